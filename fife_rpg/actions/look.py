@@ -39,7 +39,9 @@ class Look(EntityAction):
 
         Returns: A text describing the target.
         """
-        description = getattr(self.target, Description.registered_as)
+        descriptions = getattr(self.target.world.components,
+                               Description.registered_as)
+        description = descriptions[self.target]
         # pylint: disable=E0602
         text = _("You see %s. \n%s") % (_(description.view_name),
                                         _(description.desc))
@@ -69,10 +71,9 @@ class Look(EntityAction):
 
         Returns: True if the entity qualifes. False otherwise
         """
-        description = getattr(entity, Description.registered_as)
-        if description:
-            return True
-        return False
+        descriptions = getattr(entity.world.components,
+                               Description.registered_as, None)
+        return descriptions is not None and entity in descriptions
 
     @classmethod
     def register(cls, name="Look"):
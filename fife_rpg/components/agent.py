@@ -75,9 +75,8 @@ class Agent(Base):
         self.fields["new_position"].default = lambda: None
         self.fields["new_rotation"].default = lambda: None
 
-    @property
-    def saveable_fields(self):
-        """Returns the fields of the component that can be saved."""
+    def _get_saveable_fields(self):
+        """Determines the fields of the component that can be saved."""
         fields = list(self.fields.keys())
         fields.remove("new_map")
         fields.remove("new_layer")
@@ -28,7 +28,7 @@ from bGrease.component import Component
 
 from fife_rpg.components import ComponentManager
 from fife_rpg.exceptions import AlreadyRegisteredError, NotRegisteredError
-from fife_rpg.helpers import ClassProperty, DoublePoint3DYaml, DoublePointYaml
+from fife_rpg.helpers import DoublePoint3DYaml, DoublePointYaml
 
 bGrease.component.field.types[DoublePoint3DYaml] = DoublePoint3DYaml
 bGrease.component.field.types[DoublePointYaml] = DoublePointYaml
@@ -39,24 +39,29 @@ class Base(Component):
     """Base component for fife-rpg.
 
     Properties:
-        registered_as: Class property that sets under what name the class is
-        registered
+        registered_as: Class attribute that holds the name the class is
+        registered under
 
         dependencies: Class property that sets the classes this Component
         depends on
     """
-    __registered_as = None
+    registered_as = None
     dependencies = []
-
-    @ClassProperty
-    @classmethod
-    def registered_as(cls):
-        """Returns the value of registered_as"""
-        return cls.__registered_as
+    _saveable_fields = None
 
     @property
     def saveable_fields(self):
         """Returns the fields of the component that can be saved."""
+        if self._saveable_fields is None:
+            self._saveable_fields = tuple(self._get_saveable_fields())
+        return self._saveable_fields
+
+    def _get_saveable_fields(self):
+        """Determines the fields of the component that can be saved.
+
+        Components that have fields which should not be saved override this.
+        The result is cached by saveable_fields.
+        """
         return list(self.fields.keys())
 
     @classmethod
@@ -73,16 +78,20 @@ class Base(Component):
         Returns:
             True if the component was registered, False if not.
         """
+        # registered_as is inherited, so only the class' own value counts
+        if cls.__dict__.get("registered_as") == name:
+            return True
+        if ComponentManager.is_registered(name):
+            print(AlreadyRegisteredError(name, "component"))
+            return False
         try:
             ComponentManager.register_component(name, cls())
-            cls.__registered_as = name
+            cls.registered_as = name
             if auto_register:
                 for sub_cls in inspect.getmro(cls):
                     if ((not (sub_cls is cls or sub_cls is Base))
                             and issubclass(sub_cls, Base)):
-                        # pylint: disable=W0212
-                        sub_cls.__registered_as = name
-                        # pylint: enable=W0212
+                        sub_cls.registered_as = name
             for dependency in cls.dependencies:
                 if not dependency.registered_as:
                     dependency.register()
@@ -103,15 +112,13 @@ class Base(Component):
             True if the component was unregistered, false if Not
         """
         try:
-            ComponentManager.unregister_component(cls.__registered_as)
-            cls.__registered_as = None
+            ComponentManager.unregister_component(cls.registered_as)
+            cls.registered_as = None
             if auto_unregister:
                 for sub_cls in inspect.getmro(cls):
                     if ((not (sub_cls is cls or sub_cls is Base))
                             and issubclass(sub_cls, Base)):
-                        # pylint: disable=W0212
-                        sub_cls.__registered_as = None
-                        # pylint: enable=W0212
+                        sub_cls.registered_as = None
             return True
         except NotRegisteredError as error:
             print(error)
@@ -50,12 +50,6 @@ class CharacterStatistics(Base):
                       primary_stats=dict, secondary_stats=dict,
                       stat_points=int, traits=list,)
 
-    @property
-    def saveable_fields(self):
-        """Returns the fields of the component that can be saved."""
-        fields = list(self.fields.keys())
-        return fields
-
     @classmethod
     def register(cls, name="CharacterStatistics", auto_register=True):
         """Registers the class as a component
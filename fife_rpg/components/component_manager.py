@@ -33,6 +33,15 @@ def get_components():
     return copy(_COMPONENTS)
 
 
+def is_registered(component_name):
+    """Checks whether a component with the name is registered
+
+    Args:
+        component_name: The name of the component
+    """
+    return component_name in _COMPONENTS
+
+
 def register_component(component_name, component_object):
     """Registers a component
 
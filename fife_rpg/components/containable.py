@@ -53,12 +53,6 @@ class Containable(Base):
         self.fields['max_stack'].default = lambda: 1
         self.fields['current_stack'].default = lambda: 1
 
-    @property
-    def saveable_fields(self):
-        """Returns the fields of the component that can be saved."""
-        fields = list(self.fields.keys())
-        return fields
-
     @classmethod
     def register(cls, name="Containable", auto_register=True):
         """Registers the class as a component
@@ -45,13 +45,6 @@ class Container(Base):
     def __init__(self):
         Base.__init__(self, max_bulk=float, max_slots=int)
 
-    @property
-    def saveable_fields(self):
-        """Returns the fields of the component that can be saved."""
-
-        fields = list(self.fields.keys())
-        return fields
-
     @classmethod
     def register(cls, name='Container', auto_register=True):
         """Registers the class as a component
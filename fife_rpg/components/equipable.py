@@ -41,12 +41,6 @@ class Equipable(Base):
     def __init__(self):
         Base.__init__(self, possible_slots=list, wearer=object, in_slot=str)
 
-    @property
-    def saveable_fields(self):
-        """Returns the fields of the component that can be saved."""
-        fields = list(self.fields.keys())
-        return fields
-
     @classmethod
     def register(cls, name="Equipable", auto_register=True):
         """Registers the class as a component
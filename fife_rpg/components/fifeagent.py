@@ -41,9 +41,8 @@ class FifeAgent(Base):
     def __init__(self):
         Base.__init__(self, layer=object, behaviour=object, instance=object)
 
-    @property
-    def saveable_fields(self):
-        """Returns the fields of the component that can be saved."""
+    def _get_saveable_fields(self):
+        """Determines the fields of the component that can be saved."""
         fields = list(self.fields.keys())
         fields.remove("layer")
         fields.remove("behaviour")
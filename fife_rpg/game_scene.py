@@ -23,25 +23,40 @@
 .. moduleauthor:: Karsten Bock <KarstenBock@gmx.net>
 """
 from builtins import object
-from abc import ABCMeta, abstractmethod
 
 from fife import fife
 from fife.fife import InstanceRenderer
 
 from fife_rpg import ViewBase
 from fife_rpg import ControllerBase
-from future.utils import with_metaclass
 
 
-class BaseOutliner(with_metaclass(ABCMeta, object)):
+class BaseOutliner(object):
 
-    """Determines the outline of an instance"""
+    """Determines the outline of an instance
+
+    Properties:
+        incremental: If true the game scene keeps the outlines of instances
+        that stay under the mouse and only passes the newly hovered instances
+        to get_outlines. If false all outlines are rebuilt whenever the
+        hovered instances change.
+
+        version: Subclasses increase this when their settings change, which
+        makes the game scene rebuild all outlines.
+    """
+
+    incremental = False
+    version = 0
 
-    @abstractmethod
     def get_outlines(self, world, instances):
         """Determines whether an instance should be outline and the data
         used for the outline.
 
+        If incremental is true an outline that was added is not evaluated
+        again while its instance stays under the mouse. Its outline must then
+        depend only on the instance itself and the outliner's settings, and
+        changing those settings has to increase version.
+
         Args:
             world: The world
 
@@ -50,6 +65,21 @@ class BaseOutliner(with_metaclass(ABCMeta, object)):
         Returns: A list with 2 tuple values: The instance that are to be
         outlined, and their outline data.
         """
+        raise NotImplementedError
+
+    def apply(self, renderer, world, instances):
+        """Adds the outlines of the instances to the renderer.
+
+        Args:
+            renderer: The :class:`fife.InstanceRenderer` to add the outlines to
+
+            world: The world
+
+            instances: A list of instances
+        """
+        add_outlined = renderer.addOutlined
+        for instance, outline_data in self.get_outlines(world, instances):
+            add_outlined(instance, *outline_data)
 
 
 class SimpleOutliner(BaseOutliner):
@@ -61,18 +91,38 @@ class SimpleOutliner(BaseOutliner):
         outline_data: A tuple of values for the outlines. It is in the order:
         (Red, Green, Blue, Width, Threshold)
 
-        outline_ignore: A list of identifiers to ignore when drawing outlines
+        outline_ignore: A frozenset of identifiers to ignore when drawing
+        outlines
     """
 
+    incremental = True
+
     def __init__(self, outline_data=None, outline_ignore=None):
-        self.outline_data = outline_data or (255, 255, 255, 1)
-        self.__outline_ignore = outline_ignore or []
+        self.outline_data = outline_data
+        self.outline_ignore = outline_ignore
+
+    @property
+    def outline_data(self):
+        """Returns outline_data"""
+        return self.__outline_data
+
+    @outline_data.setter
+    def outline_data(self, outline_data):
+        """Sets outline_data"""
+        self.__outline_data = tuple(outline_data or (255, 255, 255, 1))
+        self.version += 1
 
     @property
     def outline_ignore(self):
         """Returns outline_ignore"""
         return self.__outline_ignore
 
+    @outline_ignore.setter
+    def outline_ignore(self, outline_ignore):
+        """Sets outline_ignore"""
+        self.__outline_ignore = frozenset(outline_ignore or ())
+        self.version += 1
+
     def get_outlines(self, world, instances):
         """Determines whether an instance should be outline and the data
         used for the outline.
@@ -85,12 +135,10 @@ class SimpleOutliner(BaseOutliner):
         Returns: A list with 2 tuple values: The instance that are to be
         outlined, and their outline data.
         """
-        outlines = []
-        for instance in instances:
-            if instance.getId() in self.outline_ignore:
-                continue
-            outlines.append((instance, self.outline_data))
-        return outlines
+        outline_ignore = self.outline_ignore
+        outline_data = self.outline_data
+        return [(instance, outline_data) for instance in instances
+                if instance.getId() not in outline_ignore]
 
 
 class GameSceneListener(fife.IMouseListener):
@@ -108,8 +156,14 @@ class GameSceneListener(fife.IMouseListener):
         eventmanager: The engines eventmanager. A :class:`fife.EventManager`
 
         is_outlined: If true then outlines for instances will be drawn.
+
+        outline_grid: Size in pixels of the screen cells the mouse position is
+        snapped to. Outlines are only updated when the mouse enters another
+        cell.
     """
 
+    outline_grid = 4
+
     def __init__(self, engine, gamecontroller=None):
         self.engine = engine
         self.gamecontroller = gamecontroller
@@ -117,6 +171,12 @@ class GameSceneListener(fife.IMouseListener):
         self.eventmanager = self.engine.getEventManager()
         fife.IMouseListener.__init__(self)
         self.is_outlined = False
+        self.__last_cell = None
+        self.__last_instance_ids = frozenset()
+        self.__outlined_instances = {}
+        self.__outlined_map = None
+        self.__outliner = None
+        self.__outliner_version = None
 
     @property
     def outline_ignore(self):
@@ -125,11 +185,20 @@ class GameSceneListener(fife.IMouseListener):
 
     def activate(self):
         """Makes the listener receive events"""
+        self.reset_outline_cache()
         self.eventmanager.addMouseListener(self)
 
     def deactivate(self):
         """Makes the listener receive events"""
         self.eventmanager.removeMouseListener(self)
+        self.reset_outline_cache()
+
+    def reset_outline_cache(self):
+        """Forces the outlines to be recalculated on the next mouse move"""
+        self.__last_cell = None
+        self.__last_instance_ids = frozenset()
+        self.__outlined_instances = {}
+        self.__outlined_map = None
 
     def mousePressed(self, event):  # pylint: disable=C0103,W0221
         """Called when a mouse button was pressed.
@@ -149,22 +218,55 @@ class GameSceneListener(fife.IMouseListener):
             controller = self.gamecontroller
             if controller is None:
                 return
-            game_map = controller.application.current_map
+            application = controller.application
+            game_map = application.current_map
             if game_map:
-                renderer = InstanceRenderer.getInstance(game_map.camera)
-
-                renderer.removeAllOutlines()
-
-                point = fife.ScreenPoint(event.getX(), event.getY())
+                outliner = controller.outliner
+                if (outliner is not self.__outliner or
+                        outliner.version != self.__outliner_version):
+                    self.reset_outline_cache()
+                    self.__outliner = outliner
+                    self.__outliner_version = outliner.version
+                pos_x = event.getX()
+                pos_y = event.getY()
+                cell = (game_map, pos_x // self.outline_grid,
+                        pos_y // self.outline_grid)
+                if cell == self.__last_cell:
+                    return
+                self.__last_cell = cell
+
+                camera = game_map.camera
+                point = fife.ScreenPoint(pos_x, pos_y)
                 instances = []
+                add_instances = instances.extend
+                get_instances_at = game_map.get_instances_at
                 for layer in game_map.fife_map.getLayers():
-                    instances.extend(game_map.get_instances_at(
-                        point,
-                        layer))
-                world = controller.application.world
-                outlines = controller.outliner.get_outlines(world, instances)
-                for instance, outline_data in outlines:
-                    renderer.addOutlined(instance, *outline_data)
+                    add_instances(get_instances_at(point, layer))
+                hovered = {}
+                for instance in instances:
+                    hovered[instance.getFifeId()] = instance
+                instance_ids = frozenset(hovered)
+                last_ids = self.__last_instance_ids
+                if instance_ids == last_ids:
+                    return
+
+                renderer = InstanceRenderer.getInstance(camera)
+                if (outliner.incremental and
+                        game_map is self.__outlined_map and
+                        hasattr(renderer, "removeOutlined")):
+                    # Only touch the instances the mouse entered or left
+                    remove_outlined = renderer.removeOutlined
+                    outlined_instances = self.__outlined_instances
+                    for fife_id in last_ids - instance_ids:
+                        remove_outlined(outlined_instances[fife_id])
+                    instances = [hovered[fife_id] for fife_id in
+                                 instance_ids - last_ids]
+                else:
+                    renderer.removeAllOutlines()
+                outliner.apply(renderer, application.world, instances)
+                self.__last_instance_ids = instance_ids
+                self.__outlined_instances = hovered
+                self.__outlined_map = game_map
 
     def mouseReleased(self, event):  # pylint: disable=C0103,W0221
         """Called when a mouse button was released.
@@ -24,7 +24,6 @@ from bGrease import System
 
 from fife_rpg.exceptions import AlreadyRegisteredError, NotRegisteredError
 from fife_rpg.systems import SystemManager
-from fife_rpg.helpers import ClassProperty
 
 
 class Base(System):  # pylint: disable=abstract-method
@@ -32,22 +31,16 @@ class Base(System):  # pylint: disable=abstract-method
     """Base system for fife-rpg.
 
     Properties:
-        registered_as: Class property that sets under what name the class is
-        registered
+        registered_as: Class attribute that holds the name the class is
+        registered under
 
         dependencies: Class property that sets the classes this System depends
         on
     """
 
-    __registered_as = None
+    registered_as = None
     dependencies = []
 
-    @ClassProperty
-    @classmethod
-    def registered_as(cls):
-        """Returns the value of registered_as"""
-        return cls.__registered_as
-
     @classmethod
     def register(cls, name):
         """Registers the class as a system
@@ -58,6 +51,12 @@ class Base(System):  # pylint: disable=abstract-method
         Returns:
             True if the system was registered, False if not.
         """
+        # registered_as is inherited, so only the class' own value counts
+        if cls.__dict__.get("registered_as") == name:
+            return True
+        if SystemManager.is_registered(name):
+            print(AlreadyRegisteredError(name, "system"))
+            return False
         try:
             for dependency in cls.dependencies:
                 if not dependency.registered_as:
@@ -65,7 +64,7 @@ class Base(System):  # pylint: disable=abstract-method
             # pylint: disable=abstract-class-instantiated
             SystemManager.register_system(name, cls())
             # pylint: enable=abstract-class-instantiated
-            cls.__registered_as = name
+            cls.registered_as = name
             return True
         except AlreadyRegisteredError as error:
             print(error)
@@ -79,8 +78,24 @@ class Base(System):  # pylint: disable=abstract-method
             True if the system was unregistered, false if Not
         """
         try:
-            SystemManager.unregister_system(cls.__registered_as)
-            cls.__registered_as = None
+            SystemManager.unregister_system(cls.registered_as)
+            cls.registered_as = None
         except NotRegisteredError as error:
             print(error)
             return False
+
+    def get_pool(self, component_cls):
+        """Returns the component object of a component in the world of this
+        system
+
+        Args:
+            component_cls: The class of the component
+
+        Returns:
+            The component object or None if the component is not registered
+            or not part of the world.
+        """
+        name = component_cls.registered_as
+        if not name:
+            return None
+        return getattr(self.world.components, name, None)
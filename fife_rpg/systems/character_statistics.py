@@ -456,10 +456,10 @@ class CharacterStatisticSystem(Base):
         Args:
             time_delta: Time elapsed since last step
         """
-        comp_name = CharacterStatistics.registered_as
-        entity_extent = getattr(self.world[RPGEntity], comp_name)
-        for entity in entity_extent:
-            stats_component = getattr(entity, comp_name)
+        stats_pool = self.get_pool(CharacterStatistics)
+        entities = self.world[RPGEntity].entities & stats_pool.entities
+        for entity in entities:
+            stats_component = stats_pool[entity]
             comp_secondary_stats = stats_component.secondary_stats
             for statistic_name, statistic in (
                     iter(self.secondary_statistics.items())):
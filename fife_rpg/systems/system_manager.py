@@ -32,6 +32,15 @@ def get_systems():
     return deepcopy(_SYSTEMS)
 
 
+def is_registered(system_name):
+    """Checks whether a system with the name is registered
+
+    Args:
+        system_name: The name of the system
+    """
+    return system_name in _SYSTEMS
+
+
 def register_system(system_name, system_object):
     """Registers an system
 
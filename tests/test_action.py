@@ -12,10 +12,16 @@
 #   You should have received a copy of the GNU General Public License
 #   along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import gettext
 import unittest
 
+from bGrease.world import BaseWorld
+from bGrease.entity import Entity
+
 from fife_rpg.actions import ActionManager
 from fife_rpg.actions.base import BaseAction
+from fife_rpg.actions.look import Look
+from fife_rpg.components.description import Description
 
 class TestAction(BaseAction):
 
@@ -72,3 +78,33 @@ class ManagerTest(unittest.TestCase):
         self.assertRaises(ActionManager.AlreadyRegisteredError,
                               self.reg_command_func,
                               *self.reg_command_params)
+
+class LookWorld(BaseWorld):
+
+    def configure(self):
+        self.components.description = Description()
+
+class LookTest(unittest.TestCase):
+    """Test the look action"""
+
+    def setUp(self):
+        gettext.install("fife_rpg")
+        Description.registered_as = "description"
+        self.world = LookWorld()
+        self.described = Entity(self.world)
+        self.described.description.view_name = "a chest"
+        self.described.description.desc = "It is locked."
+        self.undescribed = Entity(self.world)
+
+    def tearDown(self):
+        Description.registered_as = None
+
+    def test_check_target(self):
+        self.assertTrue(Look.check_target(self.described))
+        self.assertFalse(Look.check_target(self.undescribed))
+        Description.registered_as = "missing"
+        self.assertFalse(Look.check_target(self.described))
+
+    def test_execute(self):
+        action = Look(None, None, self.described)
+        self.assertEqual(action.execute(), "You see a chest. \nIt is locked.")
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from bGrease.world import BaseWorld
+
+from fife_rpg.components import ComponentManager
+from fife_rpg.components.agent import Agent
+from fife_rpg.components.base import Base as ComponentBase
+from fife_rpg.components.fifeagent import FifeAgent
+from fife_rpg.systems import SystemManager
+from fife_rpg.systems.base import Base as SystemBase
+
+class TestComponent(ComponentBase):
+
+    def __init__(self):
+        ComponentBase.__init__(self, value=int)
+
+class OtherComponent(ComponentBase):
+
+    def __init__(self):
+        ComponentBase.__init__(self, value=int)
+
+class SubComponent(TestComponent):
+    pass
+
+class TestSystem(SystemBase):
+
+    dependencies = [TestComponent]
+
+    def step(self, time_delta):
+        pass
+
+class SubSystem(TestSystem):
+    pass
+
+class OtherSystem(SystemBase):
+
+    def step(self, time_delta):
+        pass
+
+class TestWorld(BaseWorld):
+
+    def configure(self):
+        self.components.test = TestComponent()
+        self.systems.test = TestSystem()
+
+class ComponentTest(unittest.TestCase):
+    """Test the base component"""
+
+    def test_saveable_fields(self):
+        component = TestComponent()
+        self.assertEqual(component.saveable_fields, ("value",))
+        self.assertIs(component.saveable_fields, component.saveable_fields)
+
+    def test_excluded_fields(self):
+        saveable_fields = Agent().saveable_fields
+        for field in ("new_map", "new_layer", "new_position", "new_rotation"):
+            self.assertNotIn(field, saveable_fields)
+        self.assertIn("map", saveable_fields)
+        self.assertEqual(FifeAgent().saveable_fields, ())
+
+class SystemTest(unittest.TestCase):
+    """Test the base system"""
+
+    def setUp(self):
+        TestComponent.registered_as = "test"
+        self.world = TestWorld()
+
+    def tearDown(self):
+        TestComponent.registered_as = None
+
+    def test_get_pool(self):
+        system = self.world.systems.test
+        self.assertIs(system.get_pool(TestComponent),
+                      self.world.components.test)
+        self.assertIsNone(system.get_pool(OtherComponent))
+        OtherComponent.registered_as = "other"
+        try:
+            self.assertIsNone(system.get_pool(OtherComponent))
+        finally:
+            OtherComponent.registered_as = None
+
+class RegistrationTest(unittest.TestCase):
+    """Test registering components and systems"""
+
+    def tearDown(self):
+        SystemManager.clear_systems()
+        ComponentManager.clear_components()
+
+    def test_register_same_name(self):
+        self.assertTrue(TestComponent.register("test"))
+        self.assertTrue(TestComponent.register("test"))
+        self.assertTrue(TestSystem.register("test"))
+        self.assertTrue(TestSystem.register("test"))
+
+    def test_register_inherited_name(self):
+        self.assertTrue(TestComponent.register("test"))
+        self.assertFalse(SubComponent.register("test"))
+        self.assertTrue(TestSystem.register("test"))
+        self.assertFalse(SubSystem.register("test"))
+
+    def test_register_duplicate_name(self):
+        self.assertTrue(TestComponent.register("test"))
+        self.assertFalse(OtherComponent.register("test"))
+        self.assertIsNone(OtherComponent.registered_as)
+        self.assertTrue(TestSystem.register("test"))
+        self.assertFalse(OtherSystem.register("test"))
+        self.assertIsNone(OtherSystem.registered_as)